@@ -4,18 +4,19 @@
 An MCP server for managing the SAPA Data Science community speaker database via Notion.
 """
 
-import os
-import sys
+import atexit
+from collections import defaultdict
 from typing import Optional
 
 from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+# Load environment variables before anything that might read them
+load_dotenv()
 
+from mcp.server.fastmcp import FastMCP
 from sapa_speaker_tracker import (
     NotionSpeakerClient,
+    Speaker,
     SpeakerCreate,
     SpeakerUpdate,
     ContactStatus,
@@ -23,8 +24,23 @@ from sapa_speaker_tracker import (
     FieldSpecialty,
 )
 
-# Load environment variables
-load_dotenv()
+# Enum lookups and error hints for validating tool arguments
+_FIELD_MAP = {f.value: f for f in FieldSpecialty}
+_STATUS_MAP = {s.value: s for s in ContactStatus}
+_PRIORITY_MAP = {p.value: p for p in Priority}
+_FIELD_OPTS = str([f.value for f in FieldSpecialty])
+_STATUS_OPTS = str([s.value for s in ContactStatus])
+_PRIORITY_OPTS = str([p.value for p in Priority])
+# Position of each status in the contact lifecycle, for ordering groups
+_STATUS_ORDER = {s.value: i for i, s in enumerate(ContactStatus)}
+
+# Search result block; optional fields are pre-rendered with their own "\n" prefix
+_SPEAKER_TEMPLATE = (
+    "---\n"
+    "Name: {name}\n"
+    "ID: {id}{field}{affiliation}{position}\n"
+    "Status: {status}{priority}{email}"
+)
 
 # Initialize MCP server
 mcp = FastMCP("SAPA Speaker Tracker")
@@ -33,11 +49,47 @@ mcp = FastMCP("SAPA Speaker Tracker")
 _notion_client: Optional[NotionSpeakerClient] = None
 
 
+def _parse_enum(value: Optional[str], mapping: dict, name: str, options: str) -> tuple:
+    """Resolve a tool argument to its enum member.
+
+    Returns:
+        Tuple of (enum member or None, error message or None).
+    """
+    if not value:
+        return None, None
+    member = mapping.get(value)
+    if member is None:
+        return None, f"Error: Invalid {name} '{value}'. Valid options: {options}"
+    return member, None
+
+
+def _format_speaker(s: Speaker) -> str:
+    """Format a speaker as a search result block."""
+    return _SPEAKER_TEMPLATE.format(
+        name=s.name,
+        id=s.id,
+        field=f"\nField: {s.field_specialty.value}" if s.field_specialty else "",
+        affiliation=f"\nAffiliation: {s.affiliation}" if s.affiliation else "",
+        position=f"\nPosition: {s.position}" if s.position else "",
+        status=s.contact_status.value,
+        priority=f"\nPriority: {s.priority.value}" if s.priority else "",
+        email=f"\nEmail: {s.email}" if s.email else "",
+    )
+
+
+def _format_list_line(s: Speaker) -> str:
+    """Format a speaker as a one-line list entry."""
+    affiliation = f" ({s.affiliation})" if s.affiliation else ""
+    priority = f" [{s.priority.value}]" if s.priority else ""
+    return f"- {s.name}{affiliation}{priority}"
+
+
 def get_notion_client() -> NotionSpeakerClient:
     """Get or create the Notion client."""
     global _notion_client
     if _notion_client is None:
         _notion_client = NotionSpeakerClient()
+        atexit.register(_notion_client.close)
     return _notion_client
 
 
@@ -76,25 +128,15 @@ def add_speaker(
     """
     try:
         # Parse enums
-        field_enum = None
-        if field_specialty:
-            try:
-                field_enum = FieldSpecialty(field_specialty)
-            except ValueError:
-                return f"Error: Invalid field_specialty '{field_specialty}'. Valid options: {[f.value for f in FieldSpecialty]}"
-
-        status_enum = ContactStatus.NOT_CONTACTED
-        try:
-            status_enum = ContactStatus(contact_status)
-        except ValueError:
-            return f"Error: Invalid contact_status '{contact_status}'. Valid options: {[s.value for s in ContactStatus]}"
-
-        priority_enum = None
-        if priority:
-            try:
-                priority_enum = Priority(priority)
-            except ValueError:
-                return f"Error: Invalid priority '{priority}'. Valid options: {[p.value for p in Priority]}"
+        field_enum, error = _parse_enum(field_specialty, _FIELD_MAP, "field_specialty", _FIELD_OPTS)
+        if error:
+            return error
+        status_enum, error = _parse_enum(contact_status, _STATUS_MAP, "contact_status", _STATUS_OPTS)
+        if error:
+            return error
+        priority_enum, error = _parse_enum(priority, _PRIORITY_MAP, "priority", _PRIORITY_OPTS)
+        if error:
+            return error
 
         speaker = SpeakerCreate(
             name=name,
@@ -103,7 +145,7 @@ def add_speaker(
             position=position,
             linkedin_url=linkedin_url,
             potential_topics=potential_topics or [],
-            contact_status=status_enum,
+            contact_status=status_enum or ContactStatus.NOT_CONTACTED,
             research_notes=research_notes,
             email=email,
             priority=priority_enum,
@@ -140,26 +182,15 @@ def search_speakers(
     """
     try:
         # Parse enums
-        field_enum = None
-        if field_specialty:
-            try:
-                field_enum = FieldSpecialty(field_specialty)
-            except ValueError:
-                return f"Error: Invalid field_specialty. Valid options: {[f.value for f in FieldSpecialty]}"
-
-        status_enum = None
-        if contact_status:
-            try:
-                status_enum = ContactStatus(contact_status)
-            except ValueError:
-                return f"Error: Invalid contact_status. Valid options: {[s.value for s in ContactStatus]}"
-
-        priority_enum = None
-        if priority:
-            try:
-                priority_enum = Priority(priority)
-            except ValueError:
-                return f"Error: Invalid priority. Valid options: {[p.value for p in Priority]}"
+        field_enum, error = _parse_enum(field_specialty, _FIELD_MAP, "field_specialty", _FIELD_OPTS)
+        if error:
+            return error
+        status_enum, error = _parse_enum(contact_status, _STATUS_MAP, "contact_status", _STATUS_OPTS)
+        if error:
+            return error
+        priority_enum, error = _parse_enum(priority, _PRIORITY_MAP, "priority", _PRIORITY_OPTS)
+        if error:
+            return error
 
         client = get_notion_client()
         speakers = client.search_speakers(
@@ -173,24 +204,8 @@ def search_speakers(
         if not speakers:
             return "No speakers found matching the criteria."
 
-        result_lines = [f"Found {len(speakers)} speaker(s):\n"]
-        for s in speakers:
-            result_lines.append(f"---")
-            result_lines.append(f"Name: {s.name}")
-            result_lines.append(f"ID: {s.id}")
-            if s.field_specialty:
-                result_lines.append(f"Field: {s.field_specialty.value}")
-            if s.affiliation:
-                result_lines.append(f"Affiliation: {s.affiliation}")
-            if s.position:
-                result_lines.append(f"Position: {s.position}")
-            result_lines.append(f"Status: {s.contact_status.value}")
-            if s.priority:
-                result_lines.append(f"Priority: {s.priority.value}")
-            if s.email:
-                result_lines.append(f"Email: {s.email}")
-
-        return "\n".join(result_lines)
+        body = "\n".join(_format_speaker(s) for s in speakers)
+        return f"Found {len(speakers)} speaker(s):\n\n{body}"
 
     except Exception as e:
         return f"Error searching speakers: {str(e)}"
@@ -230,26 +245,15 @@ def update_speaker(
     """
     try:
         # Parse enums
-        field_enum = None
-        if field_specialty:
-            try:
-                field_enum = FieldSpecialty(field_specialty)
-            except ValueError:
-                return f"Error: Invalid field_specialty. Valid options: {[f.value for f in FieldSpecialty]}"
-
-        status_enum = None
-        if contact_status:
-            try:
-                status_enum = ContactStatus(contact_status)
-            except ValueError:
-                return f"Error: Invalid contact_status. Valid options: {[s.value for s in ContactStatus]}"
-
-        priority_enum = None
-        if priority:
-            try:
-                priority_enum = Priority(priority)
-            except ValueError:
-                return f"Error: Invalid priority. Valid options: {[p.value for p in Priority]}"
+        field_enum, error = _parse_enum(field_specialty, _FIELD_MAP, "field_specialty", _FIELD_OPTS)
+        if error:
+            return error
+        status_enum, error = _parse_enum(contact_status, _STATUS_MAP, "contact_status", _STATUS_OPTS)
+        if error:
+            return error
+        priority_enum, error = _parse_enum(priority, _PRIORITY_MAP, "priority", _PRIORITY_OPTS)
+        if error:
+            return error
 
         updates = SpeakerUpdate(
             name=name,
@@ -274,41 +278,39 @@ def update_speaker(
 
 
 @mcp.tool()
-def list_speakers(limit: int = 50) -> str:
+def list_speakers(limit: int = 50, contact_status: Optional[str] = None) -> str:
     """List all speakers in the database.
 
     Args:
         limit: Maximum number of speakers to return (default: 50)
+        contact_status: Only list speakers with this contact status
 
     Returns:
         List of all speakers with summary information.
     """
     try:
+        status_enum, error = _parse_enum(contact_status, _STATUS_MAP, "contact_status", _STATUS_OPTS)
+        if error:
+            return error
+
         client = get_notion_client()
-        speakers = client.list_speakers(limit=limit)
+        speakers = client.list_speakers(limit=limit, contact_status=status_enum)
 
         if not speakers:
+            if status_enum:
+                return f"No speakers with contact status '{status_enum.value}'."
             return "No speakers in the database yet."
 
         result_lines = [f"Total speakers: {len(speakers)}\n"]
 
-        # Group by status
-        by_status = {}
+        # Group by status, in contact lifecycle order
+        by_status: dict[str, list[Speaker]] = defaultdict(list)
         for s in speakers:
-            status = s.contact_status.value
-            if status not in by_status:
-                by_status[status] = []
-            by_status[status].append(s)
+            by_status[s.contact_status.value].append(s)
 
-        for status, speakers_in_status in by_status.items():
+        for status, speakers_in_status in sorted(by_status.items(), key=lambda kv: _STATUS_ORDER[kv[0]]):
             result_lines.append(f"\n## {status} ({len(speakers_in_status)})")
-            for s in speakers_in_status:
-                line = f"- {s.name}"
-                if s.affiliation:
-                    line += f" ({s.affiliation})"
-                if s.priority:
-                    line += f" [{s.priority.value}]"
-                result_lines.append(line)
+            result_lines.append("\n".join(_format_list_line(s) for s in speakers_in_status))
 
         return "\n".join(result_lines)
 
@@ -330,39 +332,34 @@ def get_speaker_details(speaker_id: str) -> str:
         client = get_notion_client()
         s = client.get_speaker(speaker_id)
 
-        lines = [
-            f"# {s.name}",
-            f"",
-            f"**Notion ID:** {s.id}",
-            f"**Notion URL:** {s.url or 'N/A'}",
-            f"",
-            f"## Professional Info",
-            f"- **Field/Specialty:** {s.field_specialty.value if s.field_specialty else 'Not specified'}",
-            f"- **Affiliation:** {s.affiliation or 'Not specified'}",
-            f"- **Position:** {s.position or 'Not specified'}",
-            f"",
-            f"## Contact",
-            f"- **Email:** {s.email or 'Not specified'}",
-            f"- **LinkedIn:** {s.linkedin_url or 'Not specified'}",
-            f"- **Status:** {s.contact_status.value}",
-            f"- **Priority:** {s.priority.value if s.priority else 'Not set'}",
-            f"",
-            f"## Potential Topics",
-        ]
-
+        field = s.field_specialty.value if s.field_specialty else "Not specified"
+        priority = s.priority.value if s.priority else "Not set"
         if s.potential_topics:
-            for topic in s.potential_topics:
-                lines.append(f"- {topic}")
+            topics = "\n".join(f"- {topic}" for topic in s.potential_topics)
         else:
-            lines.append("- None specified")
+            topics = "- None specified"
+
+        return f"""# {s.name}
+
+**Notion ID:** {s.id}
+**Notion URL:** {s.url or 'N/A'}
+
+## Professional Info
+- **Field/Specialty:** {field}
+- **Affiliation:** {s.affiliation or 'Not specified'}
+- **Position:** {s.position or 'Not specified'}
+
+## Contact
+- **Email:** {s.email or 'Not specified'}
+- **LinkedIn:** {s.linkedin_url or 'Not specified'}
+- **Status:** {s.contact_status.value}
+- **Priority:** {priority}
 
-        lines.extend([
-            f"",
-            f"## Research Notes",
-            s.research_notes or "No notes yet.",
-        ])
+## Potential Topics
+{topics}
 
-        return "\n".join(lines)
+## Research Notes
+{s.research_notes or "No notes yet."}"""
 
     except Exception as e:
         return f"Error getting speaker details: {str(e)}"
@@ -1,7 +1,7 @@
 """SAPA Speaker Tracker - MCP server for managing speaker database via Notion."""
 
 from .models import Speaker, SpeakerCreate, SpeakerUpdate, ContactStatus, Priority, FieldSpecialty
-from .notion_client import NotionSpeakerClient
+from .notion_client import NotionAPIError, NotionSpeakerClient
 
 __all__ = [
     "Speaker",
@@ -11,4 +11,5 @@ __all__ = [
     "Priority",
     "FieldSpecialty",
     "NotionSpeakerClient",
+    "NotionAPIError",
 ]
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field, HttpUrl, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, EmailStr
 
 
 class FieldSpecialty(str, Enum):
@@ -72,8 +72,7 @@ class SpeakerUpdate(BaseModel):
 
 class Speaker(SpeakerBase):
     """Full speaker model with Notion metadata."""
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
+
     id: str = Field(..., description="Notion page ID")
     url: Optional[str] = Field(None, description="Notion page URL")
-
-    class Config:
-        from_attributes = True
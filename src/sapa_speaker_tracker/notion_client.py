@@ -1,10 +1,14 @@
 """Notion API wrapper for SAPA Speaker Tracker."""
 
 import os
-from typing import Optional
-import httpx
-from notion_client import Client
-from notion_client.errors import APIResponseError
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Iterator, Optional
+import orjson
+from cachetools import TTLCache
+from pydantic import TypeAdapter
 
 from .models import (
     Speaker,
@@ -16,11 +20,133 @@ from .models import (
 )
 
 NOTION_API_VERSION = "2022-06-28"
+NOTION_API_BASE_URL = "https://api.notion.com"
+READ_CACHE_SIZE = 500
+READ_CACHE_TTL = 120  # seconds
+# Notion allows an average of 3 requests/second; stay a little below it.
+RATE_LIMIT_PER_SECOND = 2.7
+RATE_LIMIT_BURST = 3
+CONNECTION_CHECK_TTL = 30  # seconds
+
+# Enum value -> member maps, so parsing pages is a dict lookup rather than
+# an enum constructor call that raises on unknown values.
+_FIELD_SPECIALTIES = FieldSpecialty._value2member_map_
+_CONTACT_STATUSES = ContactStatus._value2member_map_
+_PRIORITIES = Priority._value2member_map_
+
+# Validates a whole result set in one call into pydantic-core.
+_SPEAKER_LIST = TypeAdapter(list[Speaker])
+
+
+def _title(value: str) -> dict:
+    return {"title": [{"text": {"content": value}}]}
+
+
+def _rich_text(value: str) -> dict:
+    return {"rich_text": [{"text": {"content": value}}]}
+
+
+def _select(value: Enum) -> dict:
+    return {"select": {"name": value.value}}
+
+
+def _multi_select(values: list[str]) -> dict:
+    return {"multi_select": [{"name": v} for v in values]}
+
+
+def _url(value: str) -> dict:
+    return {"url": value or None}
+
+
+def _email(value: str) -> dict:
+    return {"email": value or None}
+
+
+def _first_text(cell: dict, kind: str) -> str:
+    """Return the first text fragment of a title/rich_text property, or ""."""
+    fragments = cell.get(kind)
+    return fragments[0]["text"]["content"] if fragments else ""
+
+
+def _select_name(cell: dict) -> Optional[str]:
+    """Return the selected option name of a select property, if any."""
+    option = cell.get("select")
+    return option["name"] if option else None
+
+
+def _combine_filters(filters: list[dict]) -> Optional[dict]:
+    """AND together Notion filter objects, or None if there are none."""
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return {"and": filters}
+
+
+class NotionAPIError(Exception):
+    """Error response from the Notion API.
+
+    The string form is Notion's own message (e.g. "Could not find page with
+    ID ..."), matching what notion_client's APIResponseError reports.
+    """
+
+    def __init__(self, message: str, code: Optional[str] = None, status: Optional[int] = None):
+        super().__init__(message)
+        self.code = code
+        self.status = status
+
+    @classmethod
+    def from_response(cls, response) -> "NotionAPIError":
+        """Build the error from a failed httpx response."""
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        message = body.get("message") or response.text or response.reason_phrase
+        return cls(message, code=body.get("code"), status=response.status_code)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that blocks callers to hold a request rate."""
+
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, capacity: int = RATE_LIMIT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token even if it is not there yet, so concurrent
+            # callers queue up behind each other instead of all waking at once.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
 
 
 class NotionSpeakerClient:
     """Client for interacting with Notion Speakers database."""
 
+    # (model attribute, Notion property name, property payload builder)
+    _FIELD_BUILDERS = (
+        ("name", "Name", _title),
+        ("field_specialty", "Field/Specialty", _select),
+        ("affiliation", "Affiliation", _rich_text),
+        ("position", "Position", _rich_text),
+        ("linkedin_url", "LinkedIn URL", _url),
+        ("potential_topics", "Potential Topics", _multi_select),
+        ("contact_status", "Contact Status", _select),
+        ("research_notes", "Research Notes", _rich_text),
+        ("email", "Email", _email),
+        ("priority", "Priority", _select),
+    )
+
     def __init__(self, api_key: Optional[str] = None, database_id: Optional[str] = None):
         """Initialize the Notion client.
 
@@ -36,15 +162,80 @@ class NotionSpeakerClient:
         if not self.database_id:
             raise ValueError("NOTION_DATABASE_ID is required")
 
+        # The Notion SDK and httpx are imported here rather than at module
+        # level so importing the package (e.g. at MCP server startup) stays
+        # cheap until a client is actually needed.
+        import httpx
+        from notion_client import Client
+
+        # Only used for the connection test; page reads and writes go through
+        # the pooled HTTP client below so they share its rate limit and cache.
         self.client = Client(auth=self.api_key)
         self._http_headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Notion-Version": NOTION_API_VERSION,
             "Content-Type": "application/json",
         }
+        # Long-lived client so queries reuse pooled keep-alive connections
+        # instead of paying a fresh TCP + TLS handshake per request.
+        self._http = httpx.Client(
+            base_url=NOTION_API_BASE_URL,
+            headers=self._http_headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+        # Short-lived cache of raw Notion responses for repeated reads.
+        # Cleared on every write so callers never see their own stale data.
+        self._read_cache: TTLCache = TTLCache(maxsize=READ_CACHE_SIZE, ttl=READ_CACHE_TTL)
+        # TTLCache is not thread-safe and pages are prefetched off-thread.
+        self._cache_lock = threading.Lock()
+        # Every outbound Notion request takes a token; spacing requests up
+        # front is far cheaper than backing off after a 429.
+        self._bucket = _TokenBucket()
+        # (monotonic timestamp, result) of the last successful connection test
+        self._conn_cache: Optional[tuple[float, dict]] = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def __enter__(self) -> "NotionSpeakerClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _cache_get(self, key: tuple):
+        with self._cache_lock:
+            return self._read_cache.get(key)
+
+    def _cache_put(self, key: tuple, value: dict) -> None:
+        with self._cache_lock:
+            self._read_cache[key] = value
+
+    def _invalidate_cache(self) -> None:
+        with self._cache_lock:
+            self._read_cache.clear()
 
     def _query_database(self, filter_obj: Optional[dict] = None, page_size: int = 100, start_cursor: Optional[str] = None) -> dict:
         """Query the database using direct HTTP request (workaround for notion-client 2.7.0 bug)."""
+        # The serialized body doubles as the cache key and the request payload
+        payload = self._query_payload(filter_obj, page_size, start_cursor)
+        cache_key = ("query", payload)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._request("POST", f"/v1/databases/{self.database_id}/query", payload)
+        self._cache_put(cache_key, result)
+        return result
+
+    def _cached_query(self, filter_obj: Optional[dict] = None, page_size: int = 100) -> Optional[dict]:
+        """Return a first-page query result from the read cache, without any request."""
+        return self._cache_get(("query", self._query_payload(filter_obj, page_size)))
+
+    @staticmethod
+    def _query_payload(filter_obj: Optional[dict] = None, page_size: int = 100, start_cursor: Optional[str] = None) -> bytes:
         body = {}
         if filter_obj:
             body["filter"] = filter_obj
@@ -52,126 +243,70 @@ class NotionSpeakerClient:
             body["page_size"] = page_size
         if start_cursor:
             body["start_cursor"] = start_cursor
-
-        response = httpx.post(
-            f"https://api.notion.com/v1/databases/{self.database_id}/query",
-            headers=self._http_headers,
-            json=body,
-            timeout=30.0,
-        )
-        response.raise_for_status()
+        return orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+
+    def _request(self, method: str, path: str, content: Optional[bytes] = None) -> dict:
+        """Send a rate-limited request to the Notion REST API on the pooled client."""
+        self._bucket.acquire()
+        response = self._http.request(method, path, content=content)
+        if response.is_error:
+            raise NotionAPIError.from_response(response)
         return response.json()
 
-    def _build_properties(self, speaker: SpeakerCreate | SpeakerUpdate) -> dict:
-        """Convert speaker model to Notion properties."""
-        properties = {}
-
-        if speaker.name is not None:
-            properties["Name"] = {"title": [{"text": {"content": speaker.name}}]}
-
-        if speaker.field_specialty is not None:
-            properties["Field/Specialty"] = {"select": {"name": speaker.field_specialty.value}}
-
-        if speaker.affiliation is not None:
-            properties["Affiliation"] = {"rich_text": [{"text": {"content": speaker.affiliation}}]}
+    def _create_page(self, properties: dict) -> dict:
+        body = {"parent": {"database_id": self.database_id}, "properties": properties}
+        return self._request("POST", "/v1/pages", orjson.dumps(body))
 
-        if speaker.position is not None:
-            properties["Position"] = {"rich_text": [{"text": {"content": speaker.position}}]}
+    def _retrieve_page(self, page_id: str) -> dict:
+        return self._request("GET", f"/v1/pages/{page_id}")
 
-        if speaker.linkedin_url is not None:
-            properties["LinkedIn URL"] = {"url": speaker.linkedin_url if speaker.linkedin_url else None}
-
-        if speaker.potential_topics is not None:
-            properties["Potential Topics"] = {
-                "multi_select": [{"name": topic} for topic in speaker.potential_topics]
-            }
-
-        if speaker.contact_status is not None:
-            properties["Contact Status"] = {"select": {"name": speaker.contact_status.value}}
-
-        if speaker.research_notes is not None:
-            properties["Research Notes"] = {"rich_text": [{"text": {"content": speaker.research_notes}}]}
-
-        if speaker.email is not None:
-            properties["Email"] = {"email": speaker.email if speaker.email else None}
-
-        if speaker.priority is not None:
-            properties["Priority"] = {"select": {"name": speaker.priority.value}}
+    def _update_page(self, page_id: str, body: dict) -> dict:
+        return self._request("PATCH", f"/v1/pages/{page_id}", orjson.dumps(body))
 
+    def _build_properties(self, speaker: SpeakerCreate | SpeakerUpdate) -> dict:
+        """Convert speaker model to Notion properties."""
+        properties = {}
+        for attr, notion_name, build in self._FIELD_BUILDERS:
+            value = getattr(speaker, attr)
+            if value is not None:
+                properties[notion_name] = build(value)
         return properties
 
     def _parse_page(self, page: dict) -> Speaker:
         """Convert Notion page to Speaker model."""
+        return Speaker.model_validate(self._page_fields(page))
+
+    def _parse_pages(self, pages: list[dict]) -> list[Speaker]:
+        """Convert a list of Notion pages to Speaker models in one batch."""
+        return _SPEAKER_LIST.validate_python([self._page_fields(page) for page in pages])
+
+    def _page_fields(self, page: dict) -> dict:
+        """Extract Speaker field values from a Notion page."""
         props = page["properties"]
 
-        # Extract title (Name)
-        name = ""
-        if props.get("Name", {}).get("title"):
-            name = props["Name"]["title"][0]["text"]["content"] if props["Name"]["title"] else ""
-
-        # Extract select fields
-        field_specialty = None
-        if props.get("Field/Specialty", {}).get("select"):
-            field_val = props["Field/Specialty"]["select"]["name"]
-            try:
-                field_specialty = FieldSpecialty(field_val)
-            except ValueError:
-                field_specialty = FieldSpecialty.OTHER
-
-        contact_status = ContactStatus.NOT_CONTACTED
-        if props.get("Contact Status", {}).get("select"):
-            status_val = props["Contact Status"]["select"]["name"]
-            try:
-                contact_status = ContactStatus(status_val)
-            except ValueError:
-                contact_status = ContactStatus.NOT_CONTACTED
-
-        priority = None
-        if props.get("Priority", {}).get("select"):
-            priority_val = props["Priority"]["select"]["name"]
-            try:
-                priority = Priority(priority_val)
-            except ValueError:
-                priority = None
-
-        # Extract rich text fields
-        affiliation = ""
-        if props.get("Affiliation", {}).get("rich_text"):
-            affiliation = props["Affiliation"]["rich_text"][0]["text"]["content"] if props["Affiliation"]["rich_text"] else ""
-
-        position = ""
-        if props.get("Position", {}).get("rich_text"):
-            position = props["Position"]["rich_text"][0]["text"]["content"] if props["Position"]["rich_text"] else ""
-
-        research_notes = ""
-        if props.get("Research Notes", {}).get("rich_text"):
-            research_notes = props["Research Notes"]["rich_text"][0]["text"]["content"] if props["Research Notes"]["rich_text"] else ""
-
-        # Extract URL field
-        linkedin_url = props.get("LinkedIn URL", {}).get("url")
-
-        # Extract email field
-        email = props.get("Email", {}).get("email")
-
-        # Extract multi-select (potential topics)
-        potential_topics = []
-        if props.get("Potential Topics", {}).get("multi_select"):
-            potential_topics = [item["name"] for item in props["Potential Topics"]["multi_select"]]
-
-        return Speaker(
-            id=page["id"],
-            url=page.get("url"),
-            name=name,
-            field_specialty=field_specialty,
-            affiliation=affiliation or None,
-            position=position or None,
-            linkedin_url=linkedin_url,
-            potential_topics=potential_topics,
-            contact_status=contact_status,
-            research_notes=research_notes or None,
-            email=email,
-            priority=priority,
-        )
+        # Unknown select options fall back instead of failing the whole page
+        field_val = _select_name(props.get("Field/Specialty", {}))
+        field_specialty = None if field_val is None else _FIELD_SPECIALTIES.get(field_val, FieldSpecialty.OTHER)
+        status_val = _select_name(props.get("Contact Status", {}))
+        contact_status = _CONTACT_STATUSES.get(status_val, ContactStatus.NOT_CONTACTED)
+        priority = _PRIORITIES.get(_select_name(props.get("Priority", {})))
+
+        topics = props.get("Potential Topics", {}).get("multi_select")
+
+        return {
+            "id": page["id"],
+            "url": page.get("url"),
+            "name": _first_text(props.get("Name", {}), "title"),
+            "field_specialty": field_specialty,
+            "affiliation": _first_text(props.get("Affiliation", {}), "rich_text") or None,
+            "position": _first_text(props.get("Position", {}), "rich_text") or None,
+            "linkedin_url": props.get("LinkedIn URL", {}).get("url"),
+            "potential_topics": [item["name"] for item in topics] if topics else [],
+            "contact_status": contact_status,
+            "research_notes": _first_text(props.get("Research Notes", {}), "rich_text") or None,
+            "email": props.get("Email", {}).get("email"),
+            "priority": priority,
+        }
 
     def add_speaker(self, speaker: SpeakerCreate) -> Speaker:
         """Add a new speaker to the database.
@@ -184,10 +319,8 @@ class NotionSpeakerClient:
         """
         properties = self._build_properties(speaker)
 
-        page = self.client.pages.create(
-            parent={"database_id": self.database_id},
-            properties=properties,
-        )
+        page = self._create_page(properties)
+        self._invalidate_cache()
 
         return self._parse_page(page)
 
@@ -200,7 +333,11 @@ class NotionSpeakerClient:
         Returns:
             The Speaker object.
         """
-        page = self.client.pages.retrieve(page_id=page_id)
+        cache_key = ("page", page_id)
+        page = self._cache_get(cache_key)
+        if page is None:
+            page = self._retrieve_page(page_id)
+            self._cache_put(cache_key, page)
         return self._parse_page(page)
 
     def update_speaker(self, page_id: str, updates: SpeakerUpdate) -> Speaker:
@@ -218,10 +355,8 @@ class NotionSpeakerClient:
         if not properties:
             return self.get_speaker(page_id)
 
-        page = self.client.pages.update(
-            page_id=page_id,
-            properties=properties,
-        )
+        page = self._update_page(page_id, {"properties": properties})
+        self._invalidate_cache()
 
         return self._parse_page(page)
 
@@ -245,70 +380,140 @@ class NotionSpeakerClient:
         Returns:
             List of matching Speaker objects.
         """
-        filters = []
+        # No filters is just a listing; reuse that path and its cached pages
+        if not any((name, field_specialty, affiliation, contact_status, priority)):
+            return self.list_speakers(limit=100)
 
+        # "contains" filters on text properties
+        text_filters = []
         if name:
-            filters.append({
+            text_filters.append({
                 "property": "Name",
                 "title": {"contains": name}
             })
 
-        if field_specialty:
-            filters.append({
-                "property": "Field/Specialty",
-                "select": {"equals": field_specialty.value}
-            })
-
         if affiliation:
-            filters.append({
+            text_filters.append({
                 "property": "Affiliation",
                 "rich_text": {"contains": affiliation}
             })
 
+        # exact-match filters on select properties
+        select_filters = []
+        if field_specialty:
+            select_filters.append({
+                "property": "Field/Specialty",
+                "select": {"equals": field_specialty.value}
+            })
+
         if contact_status:
-            filters.append({
+            select_filters.append({
                 "property": "Contact Status",
                 "select": {"equals": contact_status.value}
             })
 
         if priority:
-            filters.append({
+            select_filters.append({
                 "property": "Priority",
                 "select": {"equals": priority.value}
             })
 
-        filter_obj = None
-        if len(filters) == 1:
-            filter_obj = filters[0]
-        elif len(filters) > 1:
-            filter_obj = {"and": filters}
+        if len(text_filters) > 1:
+            pages = self._query_text_intersection(text_filters, select_filters)
+            if pages is not None:
+                return self._parse_pages(pages)
+
+        results = self._query_database(filter_obj=_combine_filters(text_filters + select_filters))
+
+        return self._parse_pages(results["results"])
 
-        results = self._query_database(filter_obj=filter_obj)
+    def _query_text_intersection(self, text_filters: list[dict], select_filters: list[dict]) -> Optional[list[dict]]:
+        """Answer a multi-field text search from cached single-field results.
 
-        return [self._parse_page(page) for page in results["results"]]
+        Compound "contains" filters are slow on Notion's side, but splitting
+        them only pays off when it costs no extra requests, so this never hits
+        the network: each narrow query must already be in the read cache
+        (e.g. from an earlier single-field search).
 
-    def list_speakers(self, limit: int = 100) -> list[Speaker]:
+        Returns:
+            Matching pages in Notion's order, or None if any narrow result is
+            not cached or had more than one page (intersecting a truncated
+            result set could drop matches).
+        """
+        results = []
+        for text_filter in text_filters:
+            cached = self._cached_query(_combine_filters([text_filter, *select_filters]))
+            if cached is None or cached.get("has_more"):
+                return None
+            results.append(cached)
+
+        other_ids = [{page["id"] for page in r["results"]} for r in results[1:]]
+        return [
+            page for page in results[0]["results"]
+            if all(page["id"] in ids for ids in other_ids)
+        ]
+
+    def list_speakers(self, limit: int = 100, contact_status: Optional[ContactStatus] = None) -> list[Speaker]:
         """List all speakers in the database.
 
         Args:
             limit: Maximum number of speakers to return.
+            contact_status: Only list speakers with this contact status.
 
         Returns:
             List of Speaker objects.
         """
-        results = self._query_database(page_size=min(limit, 100))
+        # Filter in Notion rather than here so unwanted pages never cross the wire
+        filter_obj = None
+        if contact_status:
+            filter_obj = {
+                "property": "Contact Status",
+                "select": {"equals": contact_status.value}
+            }
 
-        speakers = [self._parse_page(page) for page in results["results"]]
+        rows: list[dict] = []
+        remaining = limit
+        results = self._query_database(filter_obj=filter_obj, page_size=min(limit, 100))
+
+        # Notion pagination is cursor-based, so pages can't be fetched in
+        # parallel, but the next request can be in flight while the current
+        # page is parsed.
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            while True:
+                remaining -= len(results["results"])
+                next_results = None
+                if results.get("has_more") and remaining > 0:
+                    next_results = prefetch.submit(
+                        self._query_database,
+                        filter_obj=filter_obj,
+                        page_size=min(remaining, 100),
+                        start_cursor=results["next_cursor"],
+                    )
+                rows.extend(self._page_fields(page) for page in results["results"])
+                if next_results is None:
+                    break
+                results = next_results.result()
+
+        return _SPEAKER_LIST.validate_python(rows[:limit])
+
+    def iter_speakers(self, page_size: int = 100) -> Iterator[Speaker]:
+        """Iterate over all speakers, fetching pages only as they are consumed.
 
-        # Handle pagination if needed
-        while results.get("has_more") and len(speakers) < limit:
-            results = self._query_database(
-                page_size=min(limit - len(speakers), 100),
-                start_cursor=results["next_cursor"],
-            )
-            speakers.extend([self._parse_page(page) for page in results["results"]])
+        Args:
+            page_size: Speakers requested per Notion page (max 100). Match it
+                to how many you expect to read to avoid over-fetching.
 
-        return speakers[:limit]
+        Yields:
+            Speaker objects in Notion's default order.
+        """
+        start_cursor = None
+        while True:
+            results = self._query_database(page_size=min(page_size, 100), start_cursor=start_cursor)
+            for page in results["results"]:
+                yield self._parse_page(page)
+            if not results.get("has_more"):
+                return
+            start_cursor = results["next_cursor"]
 
     def delete_speaker(self, page_id: str) -> bool:
         """Archive (soft delete) a speaker.
@@ -319,7 +524,8 @@ class NotionSpeakerClient:
         Returns:
             True if successful.
         """
-        self.client.pages.update(page_id=page_id, archived=True)
+        self._update_page(page_id, {"archived": True})
+        self._invalidate_cache()
         return True
 
     def test_connection(self) -> dict:
@@ -328,13 +534,22 @@ class NotionSpeakerClient:
         Returns:
             Database info if successful.
         """
+        if self._conn_cache and time.monotonic() - self._conn_cache[0] < CONNECTION_CHECK_TTL:
+            return self._conn_cache[1]
+
+        from notion_client.errors import APIResponseError
+
         try:
+            self._bucket.acquire()
             db = self.client.databases.retrieve(database_id=self.database_id)
-            return {
+            result = {
                 "success": True,
                 "database_title": db["title"][0]["text"]["content"] if db.get("title") else "Untitled",
                 "database_id": self.database_id,
             }
+            # Only successes are cached so a fixed integration is seen at once.
+            self._conn_cache = (time.monotonic(), result)
+            return result
         except APIResponseError as e:
             return {
                 "success": False,
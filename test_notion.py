@@ -1,83 +1,102 @@
 #!/usr/bin/env python3
 """Test script to verify Notion connection and database setup."""
 
+import functools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+REQUIRED_ENV = ("NOTION_API_KEY", "NOTION_DATABASE_ID")
 
-from sapa_speaker_tracker import NotionSpeakerClient
+
+@functools.lru_cache(maxsize=1)
+def _env() -> dict:
+    """Parse .env once; real environment variables take precedence, as with load_dotenv()."""
+    return {**dotenv_values(), **os.environ}
 
 
 def main():
     """Test Notion connection."""
-    # Load environment variables
-    load_dotenv()
+    # Collect the report and write it once instead of a print() per line
+    out: list[str] = []
+    try:
+        return _run_checks(out.append)
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
 
-    api_key = os.getenv("NOTION_API_KEY")
-    database_id = os.getenv("NOTION_DATABASE_ID")
+def _run_checks(emit) -> bool:
+    """Run the connection checks, passing each report line to emit."""
+    # Imported here so merely importing this module (e.g. during test
+    # collection) doesn't pull in the client and its dependencies.
+    from sapa_speaker_tracker import NotionSpeakerClient
 
-    print("=" * 50)
-    print("SAPA Speaker Tracker - Notion Connection Test")
-    print("=" * 50)
+    env = _env()
+
+    emit("=" * 50)
+    emit("SAPA Speaker Tracker - Notion Connection Test")
+    emit("=" * 50)
 
     # Check environment variables
-    if not api_key:
-        print("\n[ERROR] NOTION_API_KEY not found in environment")
-        print("Please create a .env file with your Notion integration token")
-        print("See .env.example for the template")
+    missing = [name for name in REQUIRED_ENV if not env.get(name)]
+    if missing:
+        emit(f"\n[ERROR] Not found in environment: {', '.join(missing)}")
+        emit("Please create a .env file with your Notion integration token and database ID")
+        emit("See .env.example for the template")
         return False
 
-    if not database_id:
-        print("\n[ERROR] NOTION_DATABASE_ID not found in environment")
-        print("Please add your database ID to the .env file")
-        return False
+    api_key, database_id = itemgetter(*REQUIRED_ENV)(env)
 
-    print(f"\nAPI Key: {api_key[:10]}...{api_key[-4:]}")
-    print(f"Database ID: {database_id}")
+    emit(f"\nAPI Key: {api_key[:10]}...{api_key[-4:]}")
+    emit(f"Database ID: {database_id}")
 
     # Test connection
-    print("\nTesting connection...")
+    emit("\nTesting connection...")
     try:
         client = NotionSpeakerClient(api_key=api_key, database_id=database_id)
-        result = client.test_connection()
+        # Notion has no batch endpoint, so overlap the two requests instead
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Only the first page is requested; nothing beyond 5 speakers is fetched
+            speakers_future = pool.submit(lambda: list(islice(client.iter_speakers(page_size=5), 5)))
+            result = client.test_connection()
 
         if result["success"]:
-            print(f"\n[SUCCESS] Connected to database!")
-            print(f"Database Name: {result['database_title']}")
-            print(f"Database ID: {result['database_id']}")
+            emit(f"\n[SUCCESS] Connected to database!")
+            emit(f"Database Name: {result['database_title']}")
+            emit(f"Database ID: {result['database_id']}")
 
             # List existing speakers
-            print("\n" + "-" * 50)
-            print("Fetching existing speakers...")
-            speakers = client.list_speakers(limit=5)
+            emit("\n" + "-" * 50)
+            emit("Fetching existing speakers...")
+            speakers = speakers_future.result()
             if speakers:
-                print(f"Found {len(speakers)} speaker(s):")
+                emit(f"Found {len(speakers)} speaker(s):")
                 for s in speakers:
-                    print(f"  - {s.name} ({s.affiliation or 'No affiliation'})")
+                    emit(f"  - {s.name} ({s.affiliation or 'No affiliation'})")
             else:
-                print("No speakers in database yet (that's okay!)")
+                emit("No speakers in database yet (that's okay!)")
 
-            print("\n" + "=" * 50)
-            print("CONNECTION TEST PASSED!")
-            print("=" * 50)
+            emit("\n" + "=" * 50)
+            emit("CONNECTION TEST PASSED!")
+            emit("=" * 50)
             return True
 
         else:
-            print(f"\n[ERROR] Connection failed: {result['error']}")
-            print("\nCommon issues:")
-            print("1. Integration not connected to the database")
-            print("   - Open your database in Notion")
-            print("   - Click '...' -> 'Connections' -> Select your integration")
-            print("2. Invalid API key or database ID")
-            print("3. Integration lacks required permissions")
+            emit(f"\n[ERROR] Connection failed: {result['error']}")
+            emit("\nCommon issues:")
+            emit("1. Integration not connected to the database")
+            emit("   - Open your database in Notion")
+            emit("   - Click '...' -> 'Connections' -> Select your integration")
+            emit("2. Invalid API key or database ID")
+            emit("3. Integration lacks required permissions")
             return False
 
     except Exception as e:
-        print(f"\n[ERROR] Exception: {str(e)}")
+        emit(f"\n[ERROR] Exception: {str(e)}")
         return False
 
 